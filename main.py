@@ -1,21 +1,342 @@
 import sys
+from contextlib import contextmanager
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QComboBox, QDateEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QMessageBox, QFrame
+    QTableView, QAbstractItemView, QHeaderView, QStyledItemDelegate,
+    QMessageBox, QFrame
 )
 from PySide6.QtSql import QSqlDatabase, QSqlQuery
-from PySide6.QtCore import QDate, Qt, QRegularExpression
-from PySide6.QtGui import QRegularExpressionValidator, QColor
+from PySide6.QtCore import (
+    QDate, Qt, QRegularExpression, QAbstractTableModel, QModelIndex, QTimer,
+    QObject, QRunnable, QThreadPool, Signal, qWarning
+)
+from PySide6.QtGui import QRegularExpressionValidator, QColor, QFontMetrics
+
+
+# Amount in rupees with at most two decimal places; 12 integer digits keep
+# every accepted amount, and totals of them, well inside SQLite's 64-bit INTEGER
+_AMOUNT_RE = QRegularExpression(r'^\d{1,12}\.?\d{0,2}$')
+
+
+EXPENSES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date TEXT NOT NULL,
+        category TEXT NOT NULL,
+        amount INTEGER NOT NULL CHECK(amount > 0),
+        description TEXT NOT NULL
+    )
+"""
+
+
+def parse_paise(text):
+    """Convert a validated rupee string to integer paise exactly, e.g. "12.5" -> 1250"""
+    whole, _, frac = text.partition(".")
+    return int(whole) * 100 + int(frac.ljust(2, "0"))
+
+
+def format_paise(paise):
+    """Format an integer amount of paise as rupees, e.g. 123456 -> ₹1,234.56"""
+    return f"₹{paise // 100:,}.{paise % 100:02d}"
+
+
+# Application stylesheet, applied once on QApplication; whitespace is collapsed
+# so the style engine has less to parse
+_QSS = " ".join("""
+    QWidget {
+        font-family: 'Segoe UI';
+        font-size: 14px;
+    }
+    QPushButton {
+        padding: 8px;
+        border-radius: 6px;
+        min-width: 80px;
+    }
+    QPushButton#addButton {
+        background-color: #4CAF50;
+        color: white;
+    }
+    QPushButton#addButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton#clearButton {
+        background-color: #f44336;
+        color: white;
+    }
+    QPushButton#clearButton:hover {
+        background-color: #d32f2f;
+    }
+    QPushButton#deleteButton {
+        background-color: #607d8b;
+        color: white;
+    }
+    QPushButton#deleteButton:hover {
+        background-color: #455a64;
+    }
+    QLineEdit, QComboBox, QDateEdit {
+        padding: 5px;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+    }
+    QTableView {
+        border: 1px solid #ccc;
+    }
+    QTableView::item {
+        padding: 5px;
+    }
+    QTableView::item:selected {
+        background-color: #2196F3;
+        color: white;
+    }
+    QHeaderView::section {
+        background-color: #f0f0f0;
+        padding: 5px;
+        border: none;
+    }
+    QLabel#totalLabel {
+        font-weight: bold;
+        font-size: 16px;
+        color: #333;
+        padding: 5px;
+        background-color: #e8f5e9;
+        border-radius: 4px;
+    }
+""".split())
+
+
+@contextmanager
+def _transaction(db):
+    """Run the enclosed statements on db in one transaction, rolling back on error
+
+    Raises RuntimeError if the transaction cannot be started or committed.
+    """
+    if not db.transaction():
+        raise RuntimeError(db.lastError().text())
+    try:
+        yield
+    except Exception:
+        db.rollback()
+        raise
+    if not db.commit():
+        error = db.lastError().text()
+        db.rollback()
+        raise RuntimeError(error)
+
+
+class ExpenseModel(QAbstractTableModel):
+    """Table model serving expense rows to the view on demand"""
+
+    HEADERS = ["ID", "Date", "Category", "Amount", "Description"]
+    PAGE_SIZE = 500
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self._db = db
+        self._rows = []
+        self._total_count = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        value = row[index.column()]
+
+        if role == Qt.DisplayRole:
+            return value
+
+        if role == Qt.UserRole:
+            return row[0]
+
+        if role == Qt.TextAlignmentRole and index.column() == 3:
+            return Qt.AlignRight | Qt.AlignVCenter
+
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._rows) < self._total_count
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Fetch the next page of rows from the database"""
+        query = QSqlQuery(self._db)
+        query.setForwardOnly(True)
+        if self._rows:
+            # Seek past the last loaded (date, id) key instead of skipping OFFSET rows
+            last_id, last_date = self._rows[-1][:2]
+            query.prepare("""
+                SELECT id, date, category, amount, description
+                FROM expenses
+                WHERE (date, id) < (?, ?)
+                ORDER BY date DESC, id DESC
+                LIMIT ?
+            """)
+            query.bindValue(0, last_date)
+            query.bindValue(1, last_id)
+            query.bindValue(2, self.PAGE_SIZE)
+        else:
+            query.prepare("""
+                SELECT id, date, category, amount, description
+                FROM expenses
+                ORDER BY date DESC, id DESC
+                LIMIT ?
+            """)
+            query.bindValue(0, self.PAGE_SIZE)
+        query.exec()
+
+        # Unrolled per-row read; this loop is the hot path of every page fetch
+        value = query.value
+        new_rows = []
+        while query.next():
+            new_rows.append((value(0), value(1), value(2), value(3), value(4)))
+
+        if not new_rows:
+            self._total_count = len(self._rows)
+            return
+
+        first = len(self._rows)
+        self.beginInsertRows(parent, first, first + len(new_rows) - 1)
+        self._rows.extend(new_rows)
+        self.endInsertRows()
+
+    def reload(self):
+        """Discard loaded rows and fetch the first page again"""
+        query = QSqlQuery(self._db)
+        query.setForwardOnly(True)
+        query.exec("SELECT COUNT(*) FROM expenses")
+
+        self.beginResetModel()
+        self._rows = []
+        self._total_count = query.value(0) if query.next() else 0
+        self.endResetModel()
+
+        if self.canFetchMore():
+            self.fetchMore()
+
+    def insert_position(self, date):
+        """Find where a row with the given date belongs in date-descending order"""
+        lo, hi = 0, len(self._rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._rows[mid][1] > date:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def insert_row(self, pos, row):
+        """Insert a single row at the given position"""
+        pending = self.canFetchMore()
+        self._total_count += 1
+
+        # Rows sorting after everything loaded so far arrive with a later page
+        if pos == len(self._rows) and pending:
+            return
+
+        self.beginInsertRows(QModelIndex(), pos, pos)
+        self._rows.insert(pos, row)
+        self.endInsertRows()
+
+    def remove_row(self, pos):
+        """Remove the row at the given position"""
+        self.beginRemoveRows(QModelIndex(), pos, pos)
+        del self._rows[pos]
+        self._total_count -= 1
+        self.endRemoveRows()
+
+
+class AmountDelegate(QStyledItemDelegate):
+    """Formats raw paise amounts as rupees only when a cell is painted"""
+
+    def displayText(self, value, locale):
+        return format_paise(value)
+
+
+class ImportSignals(QObject):
+    """Signals an ImportJob uses to report back to the GUI thread"""
+
+    finished = Signal(int, object)
+    failed = Signal(str)
+
+
+class ImportJob(QRunnable):
+    """Inserts many expense rows on a worker thread over its own connection"""
+
+    # SQLite caps bound parameters per statement at 999; each row binds 4
+    CHUNK_ROWS = 999 // 4
+
+    def __init__(self, database_name, rows):
+        super().__init__()
+        self.database_name = database_name
+        self.rows = rows
+        self.signals = ImportSignals()
+
+    def run(self):
+        # Qt connections cannot be shared across threads, so open a private one
+        connection_name = f"imp-{id(self)}"
+        db = QSqlDatabase.addDatabase("QSQLITE", connection_name)
+        db.setDatabaseName(self.database_name)
+
+        try:
+            if not db.open():
+                raise RuntimeError(db.lastError().text())
+            QSqlQuery("PRAGMA synchronous=NORMAL", db)
+            amount = sum(row[2] for row in self.rows)
+            self.insert_rows(db)
+        except Exception as error:
+            # Covers SQL errors and bad row values rejected while binding; the
+            # transaction has rolled back, so report it instead of dying silently
+            self.signals.failed.emit(str(error) or type(error).__name__)
+        else:
+            self.signals.finished.emit(len(self.rows), amount)
+
+        # The handled exception's traceback, which kept the last QSqlQuery
+        # alive, is released by now, so the connection can be removed cleanly
+        db.close()
+        del db
+        QSqlDatabase.removeDatabase(connection_name)
+
+    def insert_rows(self, db):
+        """Insert all rows with multi-VALUES statements in one transaction"""
+        query = QSqlQuery(db)
+        with _transaction(db):
+            for start in range(0, len(self.rows), self.CHUNK_ROWS):
+                chunk = self.rows[start:start + self.CHUNK_ROWS]
+                query.prepare(
+                    "INSERT INTO expenses (date, category, amount, description) VALUES "
+                    + ", ".join(["(?, ?, ?, ?)"] * len(chunk))
+                )
+                for row in chunk:
+                    for value in row:
+                        query.addBindValue(value)
+
+                if not query.exec():
+                    raise RuntimeError(query.lastError().text())
 
 
 class ExpenseApp(QWidget):
+    # Bumped whenever setup_database needs to migrate an existing file
+    SCHEMA_VERSION = 1
+
     def __init__(self):
         super().__init__()
+        self._refresh_pending = False
+        self._pending_imports = 0
         self.setup_database()
         self.init_ui()
         self.load_table()
-        self.update_total()
+        self.load_total()
 
     def setup_database(self):
         """Initialize database connection and create tables if needed"""
@@ -26,89 +347,97 @@ class ExpenseApp(QWidget):
             QMessageBox.critical(None, "Database Error", "Could not open database.")
             sys.exit(1)
 
+        self.configure_database()
+        self.migrate_database()
+
         query = QSqlQuery()
+        query.exec(EXPENSES_TABLE_SQL.format(table="expenses"))
         query.exec("""
-            CREATE TABLE IF NOT EXISTS expenses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                category TEXT NOT NULL,
-                amount REAL NOT NULL CHECK(amount > 0),
-                description TEXT NOT NULL
-            )
+            CREATE INDEX IF NOT EXISTS idx_expenses_date
+            ON expenses (date DESC, id DESC)
         """)
 
+        # Prepared once and rebound on every add/delete
+        self._q_insert = QSqlQuery(self.db)
+        self._q_insert.prepare("""
+            INSERT INTO expenses (date, category, amount, description) 
+            VALUES (?, ?, ?, ?)
+        """)
+        self._q_delete = QSqlQuery(self.db)
+        self._q_delete.prepare("DELETE FROM expenses WHERE id = ?")
+
+    def migrate_database(self):
+        """Bring an expense.db written by an older version up to SCHEMA_VERSION"""
+        version = self.run_pragma("PRAGMA user_version") or 0
+        if version >= self.SCHEMA_VERSION:
+            return
+
+        query = QSqlQuery(self.db)
+        query.exec("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'expenses'")
+        if not query.next():
+            self.run_pragma(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            return
+
+        # Version 1: amounts moved from REAL rupees to INTEGER paise. SQLite
+        # cannot change a column type in place, so rebuild the table, carrying
+        # the AUTOINCREMENT counter over so ids of deleted rows are not reused.
+        statements = [
+            EXPENSES_TABLE_SQL.format(table="expenses_v1"),
+            """
+            INSERT INTO expenses_v1 (id, date, category, amount, description)
+            SELECT id, date, category, CAST(ROUND(amount * 100) AS INTEGER), description
+            FROM expenses
+            """,
+            "DELETE FROM sqlite_sequence WHERE name = 'expenses_v1'",
+            """
+            INSERT INTO sqlite_sequence (name, seq)
+            SELECT 'expenses_v1', seq FROM sqlite_sequence WHERE name = 'expenses'
+            """,
+            "DROP TABLE expenses",
+            "ALTER TABLE expenses_v1 RENAME TO expenses",
+            f"PRAGMA user_version = {self.SCHEMA_VERSION}",
+        ]
+
+        try:
+            with self._txn():
+                for statement in statements:
+                    if not query.exec(statement):
+                        raise RuntimeError(query.lastError().text())
+        except RuntimeError as error:
+            QMessageBox.critical(None, "Database Error",
+                               f"Could not upgrade database:\n{error}")
+            sys.exit(1)
+
+    def configure_database(self):
+        """Tune SQLite for fewer fsyncs per write and a larger page cache"""
+        journal_mode = self.run_pragma("PRAGMA journal_mode=WAL")
+        if str(journal_mode).lower() != "wal":
+            qWarning(f"SQLite WAL mode unavailable, using '{journal_mode}' journal")
+
+        self.run_pragma("PRAGMA synchronous=NORMAL")
+        self.run_pragma("PRAGMA temp_store=MEMORY")
+        self.run_pragma("PRAGMA cache_size=-20000")
+        self.run_pragma("PRAGMA mmap_size=268435456")
+
+    def run_pragma(self, pragma):
+        """Execute a PRAGMA statement and return its first result value, if any"""
+        query = QSqlQuery(pragma, self.db)
+        if query.next():
+            return query.value(0)
+        return None
+
+    def _txn(self):
+        """Run the enclosed statements in one transaction, rolling back on error"""
+        return _transaction(self.db)
+
     def init_ui(self):
         """Initialize the user interface"""
         self.setWindowTitle("Expense Tracker 2.0")
         self.resize(800, 600)
-        self.setup_styles()
         self.create_widgets()
         self.setup_layouts()
         self.setup_connections()
 
-    def setup_styles(self):
-        """Configure application styles"""
-        self.setStyleSheet("""
-            QWidget {
-                font-family: 'Segoe UI';
-                font-size: 14px;
-            }
-            QPushButton {
-                padding: 8px;
-                border-radius: 6px;
-                min-width: 80px;
-            }
-            QPushButton#addButton {
-                background-color: #4CAF50;
-                color: white;
-            }
-            QPushButton#addButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton#clearButton {
-                background-color: #f44336;
-                color: white;
-            }
-            QPushButton#clearButton:hover {
-                background-color: #d32f2f;
-            }
-            QPushButton#deleteButton {
-                background-color: #607d8b;
-                color: white;
-            }
-            QPushButton#deleteButton:hover {
-                background-color: #455a64;
-            }
-            QLineEdit, QComboBox, QDateEdit {
-                padding: 5px;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-            }
-            QTableWidget {
-                border: 1px solid #ccc;
-            }
-            QTableWidget::item {
-                padding: 5px;
-            }
-            QTableWidget::item:selected {
-                background-color: #2196F3;
-                color: white;
-            }
-            QHeaderView::section {
-                background-color: #f0f0f0;
-                padding: 5px;
-                border: none;
-            }
-            QLabel#totalLabel {
-                font-weight: bold;
-                font-size: 16px;
-                color: #333;
-                padding: 5px;
-                background-color: #e8f5e9;
-                border-radius: 4px;
-            }
-        """)
-
     def create_widgets(self):
         """Create all UI widgets"""
         # Date input
@@ -124,7 +453,7 @@ class ExpenseApp(QWidget):
         # Amount input with validation
         self.amount_input = QLineEdit()
         self.amount_input.setPlaceholderText("0.00")
-        amount_validator = QRegularExpressionValidator(QRegularExpression(r'^\d+\.?\d{0,2}$'))
+        amount_validator = QRegularExpressionValidator(_AMOUNT_RE)
         self.amount_input.setValidator(amount_validator)
 
         # Description input
@@ -141,23 +470,38 @@ class ExpenseApp(QWidget):
         self.delete_button = QPushButton("Delete")
         self.delete_button.setObjectName("deleteButton")
 
-        # Table widget with improved selection visibility
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setHorizontalHeaderLabels(["ID", "Date", "Category", "Amount", "Description"])
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        # Table view with improved selection visibility
+        self.model = ExpenseModel(self.db, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(3, AmountDelegate(self.table))
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.setAlternatingRowColors(True)
-        self.table.horizontalHeader().setStretchLastSection(True)
         self.table.verticalHeader().setVisible(False)
         self.table.setShowGrid(False)
+        self.setup_column_widths()
 
         # Total label
         self.total_label = QLabel("Total: ₹0.00")
         self.total_label.setObjectName("totalLabel")
         self.total_label.setAlignment(Qt.AlignRight)
 
+    def setup_column_widths(self):
+        """Fix column widths once from representative values instead of measuring every row"""
+        self.table.ensurePolished()
+        metrics = QFontMetrics(self.table.font())
+        samples = ["000000", "2025-12-31", "Entertainment", "₹999,999.99"]
+
+        header = self.table.horizontalHeader()
+        for col, sample in enumerate(samples):
+            text_width = max(metrics.horizontalAdvance(sample),
+                             metrics.horizontalAdvance(ExpenseModel.HEADERS[col]))
+            header.setSectionResizeMode(col, QHeaderView.Fixed)
+            self.table.setColumnWidth(col, text_width + 24)
+        header.setSectionResizeMode(len(samples), QHeaderView.Stretch)
+
     def setup_layouts(self):
         """Set up the application layout"""
         main_layout = QVBoxLayout()
@@ -222,41 +566,35 @@ class ExpenseApp(QWidget):
         self.date_box.setDate(QDate.currentDate())
         self.amount_input.setFocus()
 
-    def update_total(self):
-        """Calculate and display the total of all expenses"""
-        total = 0.0
-        query = QSqlQuery("SELECT SUM(amount) FROM expenses")
+    def load_total(self):
+        """Calculate the total of all expenses once; edits adjust it by their delta"""
+        self._total = 0
+        query = QSqlQuery(self.db)
+        query.setForwardOnly(True)
+        query.exec("SELECT SUM(amount) FROM expenses")
         if query.next():
-            total = query.value(0) or 0.0
+            self._total = query.value(0) or 0
         
-        self.total_label.setText(f"Total: ₹{total:,.2f}")
+        self.update_total()
+
+    def update_total(self):
+        """Display the running total without querying the database"""
+        self.total_label.setText(f"Total: {format_paise(self._total)}")
+
+    def _schedule_refresh(self):
+        """Coalesce display updates from rapid edits into one on the next event loop pass"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        """Apply the display update queued by _schedule_refresh"""
+        self._refresh_pending = False
+        self.update_total()
 
     def load_table(self):
-        """Load all expenses from database into the table"""
-        self.table.setRowCount(0)
-        
-        query = QSqlQuery("""
-            SELECT id, date, category, amount, description 
-            FROM expenses 
-            ORDER BY date DESC
-        """)
-        
-        while query.next():
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            for col in range(5):
-                value = query.value(col)
-                item = QTableWidgetItem(str(value))
-                
-                if col == 3:
-                    item.setText(f"₹{float(value):,.2f}")
-                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                
-                self.table.setItem(row, col, item)
-
-        self.table.resizeColumnsToContents()
-        self.table.setColumnWidth(3, 120)
+        """Load the first page of expenses into the table; the rest load on scroll"""
+        self.model.reload()
 
     def add_expense(self):
         """Add a new expense to the database"""
@@ -275,33 +613,70 @@ class ExpenseApp(QWidget):
             self.description_input.setFocus()
             return
 
-        try:
-            amount = float(amount_text)
-            if amount <= 0:
-                raise ValueError
-        except ValueError:
+        # The validator only admits digits with an optional decimal part
+        amount = parse_paise(amount_text)
+        if amount <= 0:
             QMessageBox.warning(self, "Input Error", "Amount must be a positive number.")
             self.amount_input.selectAll()
             self.amount_input.setFocus()
             return
 
-        query = QSqlQuery()
-        query.prepare("""
-            INSERT INTO expenses (date, category, amount, description) 
-            VALUES (?, ?, ?, ?)
-        """)
-        query.addBindValue(date)
-        query.addBindValue(category)
-        query.addBindValue(amount)
-        query.addBindValue(description)
+        query = self._q_insert
+        query.bindValue(0, date)
+        query.bindValue(1, category)
+        query.bindValue(2, amount)
+        query.bindValue(3, description)
 
         if not query.exec():
             QMessageBox.critical(self, "Database Error", 
                                f"Failed to add expense:\n{query.lastError().text()}")
         else:
+            row = (query.lastInsertId(), date, category, amount, description)
+            self.model.insert_row(self.model.insert_position(date), row)
+            self._total += amount
+            self._schedule_refresh()
             self.clear_inputs()
-            self.load_table()
-            self.update_total()
+
+    def bulk_add_expenses(self, rows):
+        """Insert many (date, category, paise, description) rows on a worker thread"""
+        rows = list(rows)
+        if not rows:
+            return
+
+        job = ImportJob(self.db.databaseName(), rows)
+        job.signals.finished.connect(self.on_import_finished)
+        job.signals.failed.connect(self.on_import_failed)
+
+        # A GUI write would block on the import's write lock, so pause editing
+        self._pending_imports += 1
+        self.set_editing_enabled(False)
+        QThreadPool.globalInstance().start(job)
+
+    def set_editing_enabled(self, enabled):
+        """Enable or disable adding and deleting expenses"""
+        for widget in (self.add_button, self.delete_button,
+                       self.amount_input, self.description_input):
+            widget.setEnabled(enabled)
+
+    def import_done(self):
+        """Re-enable editing once no ImportJob is running"""
+        self._pending_imports -= 1
+        if not self._pending_imports:
+            self.set_editing_enabled(True)
+
+    def on_import_finished(self, count, amount):
+        """Show rows added by a finished ImportJob"""
+        self.import_done()
+        # Imported rows land all over the date order, so refresh once
+        self.load_table()
+        self._total += amount
+        self._schedule_refresh()
+
+    def on_import_failed(self, error):
+        """Report an ImportJob whose transaction was rolled back"""
+        self.import_done()
+        QMessageBox.critical(self, "Database Error",
+                           f"Failed to import expenses:\n{error}")
 
     def delete_expense(self):
         """Delete the selected expense from the database"""
@@ -311,34 +686,41 @@ class ExpenseApp(QWidget):
             return
 
         row = selected_rows[0].row()
-        expense_id = self.table.item(row, 0).text()
-        amount = self.table.item(row, 3).text()
-        description = self.table.item(row, 4).text()
+        expense_id, _, _, amount, description = self.model._rows[row]
 
         confirm = QMessageBox.question(
             self, "Confirm Delete",
             f"Delete this expense?\n\n"
-            f"Amount: {amount}\n"
+            f"Amount: {format_paise(amount)}\n"
             f"Description: {description}",
             QMessageBox.Yes | QMessageBox.No
         )
 
-        if confirm == QMessageBox.Yes:
-            query = QSqlQuery()
-            query.prepare("DELETE FROM expenses WHERE id = ?")
-            query.addBindValue(expense_id)
+        if confirm != QMessageBox.Yes:
+            return
 
-            if not query.exec():
-                QMessageBox.critical(self, "Database Error", 
-                                   f"Failed to delete expense:\n{query.lastError().text()}")
-            else:
-                self.load_table()
-                self.update_total()
+        try:
+            with self._txn():
+                query = self._q_delete
+                query.bindValue(0, expense_id)
+
+                if not query.exec():
+                    raise RuntimeError(query.lastError().text())
+        except RuntimeError as error:
+            QMessageBox.critical(self, "Database Error", 
+                               f"Failed to delete expense:\n{error}")
+            return
+
+        # Only touch the view once the delete is committed
+        self.model.remove_row(row)
+        self._total -= amount
+        self._schedule_refresh()
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    app.setStyleSheet(_QSS)
     window = ExpenseApp()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file